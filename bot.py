@@ -2,16 +2,86 @@
 This module implements a bot model for playing the Rock-Paper-Scissors game.
 The model is designed as a class `RPSBot` which uses a Markov chain for prediction.
 """
+import operator
 import os
 
-from typing import List, Optional, Tuple
+from typing import List, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
 import numpy as np
+from numba import njit, prange  # type: ignore
 
+# Counter move index for each predicted state index: R -> P, P -> S, S -> R.
+_COUNTER = np.array([1, 2, 0], dtype=np.int8)
 
-@dataclass
+
+def _as_state_ids(history: np.ndarray) -> np.ndarray:
+    """
+    Validates the state indices of the states history and converts it to an int8 array.
+    The values are checked before the cast, so out of range values cannot wrap into valid ones.
+    :param history: states history as an array of state indices.
+    :return: states history as an int8 array.
+    """
+    state_ids = np.asarray(history)
+    if state_ids.size and (
+        not np.issubdtype(state_ids.dtype, np.integer)
+        or state_ids.min() < 0
+        or state_ids.max() > 2
+    ):
+        raise ValueError("Invalid state")
+    return state_ids.astype(np.int8, copy=False)
+
+
+@njit(cache=True, fastmath=True)
+def _apply_update(transitions: np.ndarray, state: int, new_state: int, lr: float) -> int:
+    """
+    Applies a single chain transition to the transitions matrix in place.
+    :param transitions: transitions matrix of the model.
+    :param state: previous chain state.
+    :param new_state: next chain state.
+    :param lr: learning rate of the model.
+    :return: counter move to the most probable next state of the updated row.
+    """
+    row = transitions[state]
+    value = row[0] - lr
+    row[0] = 0.001 if value < 0.001 else value
+    value = row[1] - lr
+    row[1] = 0.001 if value < 0.001 else value
+    value = row[2] - lr
+    row[2] = 0.001 if value < 0.001 else value
+    value = row[new_state] + lr * 3
+    row[new_state] = 0.999 if value > 0.999 else value
+    return _COUNTER[np.argmax(row)]
+
+
+@njit(cache=True, fastmath=True)
+def _train_arr(transitions: np.ndarray, history_ids: np.ndarray, lr: float) -> None:
+    """
+    Applies all the transitions of the history to the transitions matrix in place.
+    :param transitions: transitions matrix of the model.
+    :param history_ids: states history as an array of state indices.
+    :param lr: learning rate of the model.
+    :return: None
+    """
+    for i in range(1, len(history_ids)):
+        _apply_update(transitions, history_ids[i - 1], history_ids[i], lr)
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def _train_batch_arr(transitions: np.ndarray, histories: np.ndarray, lrs: np.ndarray) -> None:
+    """
+    Trains independent transitions matrices in parallel, in place.
+    :param transitions: transitions matrices of shape (B, 3, 3).
+    :param histories: states histories of shape (B, N).
+    :param lrs: learning rates of shape (B,).
+    :return: None
+    """
+    for b in prange(histories.shape[0]):  # pylint: disable=not-an-iterable
+        _train_arr(transitions[b], histories[b], lrs[b])
+
+
+@dataclass(slots=True)
 class RPSBot:
     """
     The `RPSBot` class is a bot that plays the Rock-Paper-Scissors game.
@@ -19,71 +89,109 @@ class RPSBot:
 
     Attributes:
         lr: learning rate of the model.
-        states: possible states of the model.
-        state: current state of the model.
-        transitions: transition matrix of the Markov model.
+        state: current state index of the model (0/1/2 for R/P/S).
+        _transitions: transition matrix of the Markov model, see `transitions`.
+        _responses: cached counter move to the most probable next state of each row.
     """
 
     lr: float = field(default=0.01)
-    states: Tuple[str, ...] = field(init=False, default=("R", "P", "S"))
     state: Optional[int] = field(init=False, default=None)
-    transitions: np.ndarray = field(init=False)
+    _transitions: np.ndarray = field(init=False)
+    _responses: List[int] = field(init=False, repr=False)
 
     def __post_init__(self):
-        self.transitions = np.random.rand(3, 3)
-        self.transitions /= self.transitions.sum(axis=1)[:, np.newaxis]
+        self.transitions = np.random.dirichlet(np.ones(3), size=3)
+
+    @property
+    def transitions(self) -> np.ndarray:
+        """
+        Transition matrix of the Markov model.
+        The returned matrix is read-only, since the cached counter moves depend on it.
+        Assign a new matrix to change it.
+        :return: read-only view of the transitions matrix.
+        """
+        transitions = self._transitions.view()
+        transitions.flags.writeable = False
+        return transitions
+
+    @transitions.setter
+    def transitions(self, transitions: np.ndarray) -> None:
+        """
+        Sets a copy of the matrix as the transitions matrix and refreshes the cached counter moves.
+        :param transitions: new transitions matrix of shape (3, 3).
+        :return: None
+        """
+        transitions = np.array(transitions, dtype=np.float32)
+        if transitions.shape != (3, 3):
+            raise ValueError("Invalid weights shape")
+        self._transitions = transitions
+        self._update_responses()
+
+    def _update_responses(self) -> None:
+        """
+        Recalculate the cached counter move for every row.
+        :return: None
+        """
+        self._responses = _COUNTER[np.argmax(self._transitions, axis=1)].tolist()
 
     def _calculate_stable_distribution(self) -> np.ndarray:
         """
         Calculate the stable distribution of the transitions' matrix.
+        Uses power iteration, since only the dominant eigenvector is needed.
         :return: stable distribution of the states.
         """
-        eigenvalues, eigenvectors = np.linalg.eig(self.transitions.T)
-        first_eigen = eigenvectors[:, np.where(np.abs(eigenvalues - 1.0) < 1e-8)[0][0]]
-        stable_distribution = np.real(first_eigen)
-        stable_distribution /= stable_distribution.sum()
+        stable_distribution = np.full(3, 1.0 / 3.0)
+        transitions_t = self._transitions.T
+        for _ in range(24):
+            stable_distribution = transitions_t @ stable_distribution
+            stable_distribution /= stable_distribution.sum()
         return stable_distribution
 
-    def train(self, history: List[str]) -> None:
+    def train(self, history: np.ndarray) -> None:
         """
         Trains the model based on the states' history.
-        :param history: states history.
+        The history is replayed by a compiled loop from its first move, so the current
+        state is not used as its start. The state is set to the last move of the history.
+        :param history: states history as an array of state indices.
         :return: None
         """
-        for i in range(len(history) - 1):
-            self.update_transitions(history[i + 1])
+        moves = _as_state_ids(history)
+        if moves.ndim != 1:
+            raise ValueError("Invalid history shape")
+        if not moves.size:
+            return
+        _train_arr(self._transitions, moves, self.lr)
+        self._update_responses()
+        self.state = int(moves[-1])
 
-    def update_transitions(self, move: str) -> None:
+    def update_transitions(self, move: int) -> None:
         """
         Sets new state and updates the transitions matrix.
-        :param move: next chain state.
+        :param move: next chain state index.
         :return: None
         """
-        if move not in self.states:
+        if isinstance(move, (bool, np.bool_)):
             raise ValueError("Invalid state")
-        new_state = self.states.index(move)
-        if self.state is None:
-            self.state = new_state
-            return
-        self.transitions[self.state] = np.maximum(
-            0.001, self.transitions[self.state] - self.lr
-        )
-        self.transitions[self.state, new_state] = np.minimum(
-            0.999, self.transitions[self.state, new_state] + self.lr * 3
-        )
-        self.state = new_state
+        try:
+            move = operator.index(move)
+        except TypeError as e:
+            raise ValueError("Invalid state") from e
+        if not 0 <= move <= 2:
+            raise ValueError("Invalid state")
+        if self.state is not None:
+            self._responses[self.state] = _apply_update(
+                self._transitions, self.state, move, self.lr
+            )
+        self.state = move
 
-    def predict(self) -> str:
+    def predict(self) -> int:
         """
         Predicts the next state based on current and returns a counter move.
-        :return: bot move represented by char R/P/S
+        :return: bot move represented by state index 0/1/2 (R/P/S)
         """
         if self.state is None:
-            stable_distribution = self._calculate_stable_distribution()
-            response_index = (np.argmax(stable_distribution) + 1) % 3
-        else:
-            response_index = (np.argmax(self.transitions[self.state]) + 1) % 3
-        return self.states[response_index]
+            return int(_COUNTER[self._calculate_stable_distribution().argmax()])
+        return self._responses[self.state]
 
     def reset_state(self) -> None:
         """
@@ -97,17 +205,39 @@ class RPSBot:
         Save weights of the model to the file.
         :return: None
         """
-        if not os.path.exists('logs'):
-            os.makedirs('logs')
+        os.makedirs('logs', exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        with open(f"logs/{timestamp}.txt", "w", encoding="UTF-8") as f:
-            np.savetxt(f, self.transitions)
+        np.save(f"logs/{timestamp}.npy", self._transitions)
 
     def load_weights(self, filepath: str) -> None:
         """
-        Load model weights from the file.
+        Load model weights from the `.npy` file.
         :param filepath: filepath of the weights file.
         :return: None
         """
-        self.transitions = np.loadtxt(filepath)
+        self.transitions = np.load(filepath)
+
+
+def train_batch(
+    histories: np.ndarray, lrs: np.ndarray, transitions: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Trains a batch of independent models, e.g. for learning rate sweeps.
+    :param histories: states histories as an array of state indices of shape (B, N).
+    :param lrs: learning rates of the models of shape (B,).
+    :param transitions: initial transitions matrices of shape (B, 3, 3).
+     Random ones are generated if not provided.
+    :return: trained transitions matrices of shape (B, 3, 3).
+    """
+    histories = _as_state_ids(histories)
+    lrs = np.asarray(lrs, dtype=np.float32)
+    if histories.ndim != 2 or lrs.shape != histories.shape[:1]:
+        raise ValueError("Histories and learning rates shapes mismatch")
+    if transitions is None:
+        transitions = np.random.dirichlet(np.ones(3), size=(len(lrs), 3))
+    transitions = np.array(transitions, dtype=np.float32)
+    if transitions.shape != (len(lrs), 3, 3):
+        raise ValueError("Transitions shape mismatch")
+    _train_batch_arr(transitions, histories, lrs)
+    return transitions
@@ -1,29 +1,33 @@
 """RPS game"""
 
-from enum import Enum
-from typing import List, Tuple
+from enum import Enum, IntEnum
+from typing import Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from bot import RPSBot
 
+MAX_TURNS = 30
+
 
-class RPSMove(Enum):
+class RPSMove(IntEnum):
     """
 
     :class:`RPSMove` is an enumeration class that represents moves in
-    the game of Rock-Paper-Scissors.
+    the game of Rock-Paper-Scissors. Move values match the bot's state indices.
 
     Attributes:
-        ROCK: Represents the move "Rock" with value "R".
-        PAPER: Represents the move "Paper" with value "P".
-        SCISSORS: Represents the move "Scissors" with value "S".
-        NONE: Represents no move with value "".
+        ROCK: Represents the move "Rock" with value 0.
+        PAPER: Represents the move "Paper" with value 1.
+        SCISSORS: Represents the move "Scissors" with value 2.
+        NONE: Represents no move with value -1.
     """
 
-    ROCK: str = "R"
-    PAPER: str = "P"
-    SCISSORS: str = "S"
-    NONE: str = ""
+    ROCK: int = 0
+    PAPER: int = 1
+    SCISSORS: int = 2
+    NONE: int = -1
 
 
 class GameStatus(Enum):
@@ -46,22 +50,30 @@ class GameStatus(Enum):
     DRAW: str = "DRAW"
 
 
-class RoundResult(Enum):
+class RoundResult(IntEnum):
     """
     The RoundResult class is an enumeration that represents the possible results
     of a round in a game.
 
     Attributes:
-        WIN: Represents a round result of "WIN".
-        LOSS: Represents a round result of "LOSS".
-        TIE: Represents a round result of "TIE".
-        NONE: Represents a round result of "NONE".
+        WIN: Represents a round result of "WIN" with value 0.
+        LOSS: Represents a round result of "LOSS" with value 1.
+        TIE: Represents a round result of "TIE" with value 2.
+        NONE: Represents a round result of "NONE" with value -1.
     """
 
-    WIN: str = "WIN"
-    LOSS: str = "LOSS"
-    TIE: str = "TIE"
-    NONE: str = "NONE"
+    WIN: int = 0
+    LOSS: int = 1
+    TIE: int = 2
+    NONE: int = -1
+
+
+# Round results indexed by the player's move (rows) and the bot's move (columns).
+_RESULT_TABLE = (
+    (RoundResult.TIE, RoundResult.LOSS, RoundResult.WIN),
+    (RoundResult.WIN, RoundResult.TIE, RoundResult.LOSS),
+    (RoundResult.LOSS, RoundResult.WIN, RoundResult.TIE),
+)
 
 
 def get_move_result(player_move: RPSMove, bot_move: RPSMove) -> RoundResult:
@@ -74,20 +86,15 @@ def get_move_result(player_move: RPSMove, bot_move: RPSMove) -> RoundResult:
      the RPSMove enumeration.
     :param bot_move: The move made by the bot. It should be an instance of the RPSMove enumeration.
     :return: The result of the round. It should be an instance of the RoundResult enumeration.
+     RoundResult.NONE is returned if any of the moves is RPSMove.NONE.
 
     """
-    if player_move == bot_move:
-        return RoundResult.TIE
-    if (
-        (player_move == RPSMove.ROCK and bot_move == RPSMove.SCISSORS)
-        or (player_move == RPSMove.PAPER and bot_move == RPSMove.ROCK)
-        or (player_move == RPSMove.SCISSORS and bot_move == RPSMove.PAPER)
-    ):
-        return RoundResult.WIN
-    return RoundResult.LOSS
-
-
-@dataclass
+    if player_move is RPSMove.NONE or bot_move is RPSMove.NONE:
+        return RoundResult.NONE
+    return _RESULT_TABLE[player_move][bot_move]
+
+
+@dataclass(slots=True)
 class GameState:
     """
     Represents the state of the game.
@@ -96,15 +103,42 @@ class GameState:
         player_score: The score of the player.
         bot_score: The score of the bot.
         turn: The current turn number.
-        history: The list of tuples representing the moves and results of each round.
+        history: The player's move, the bot's move and the result of each round,
+         one row per round.
+        rounds: The number of rounds stored in the history.
         status: The status of the game.
+        finished: Whether the game status has been set to a final one.
     """
 
     player_score: int = field(default=0)
     bot_score: int = field(default=0)
     turn: int = field(default=1)
-    history: List[Tuple[RPSMove, RPSMove, RoundResult]] = field(default_factory=list)
+    history: np.ndarray = field(
+        default_factory=lambda: np.zeros((MAX_TURNS, 3), dtype=np.int8), compare=False
+    )
+    rounds: int = field(default=0)
     status: GameStatus = field(default=GameStatus.PENDING)
+    finished: bool = field(default=False)
+
+    def __eq__(self, other: object) -> bool:
+        """Compares the game states, including only the played rounds of the history."""
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return (
+            self.player_score,
+            self.bot_score,
+            self.turn,
+            self.rounds,
+            self.status,
+            self.finished,
+        ) == (
+            other.player_score,
+            other.bot_score,
+            other.turn,
+            other.rounds,
+            other.status,
+            other.finished,
+        ) and np.array_equal(self.history[:self.rounds], other.history[:other.rounds])
 
     def update_score(self, round_result: RoundResult) -> None:
         """
@@ -126,22 +160,26 @@ class GameState:
         self, player_move: RPSMove, bot_move: RPSMove, round_result: RoundResult
     ) -> None:
         """Add round to the history."""
-        self.history.append((player_move, bot_move, round_result))
+        self.history[self.rounds] = (player_move, bot_move, round_result)
+        self.rounds += 1
 
     def get_last_round(self) -> Tuple[RPSMove, RPSMove, RoundResult]:
         """
         Returns the data of the last round.
         :return: player_move, bot_move, round_result
         """
-        return self.history[-1]
+        if not self.rounds:
+            raise IndexError("No rounds have been played")
+        player_move, bot_move, round_result = self.history[self.rounds - 1]
+        return RPSMove(player_move), RPSMove(bot_move), RoundResult(round_result)
 
     def is_finished(self) -> bool:
         """Checks if the game is finished without changing the game state."""
-        return self.turn == 30 or self.player_score == 10 or self.bot_score == 10
+        return self.turn == MAX_TURNS or self.player_score == 10 or self.bot_score == 10
 
     def update_status(self) -> None:
         """Changes the game state if the game is finished."""
-        if self.turn == 30:
+        if self.turn == MAX_TURNS:
             if self.player_score > self.bot_score:
                 self.status = GameStatus.WIN
             elif self.player_score < self.bot_score:
@@ -152,6 +190,7 @@ class GameState:
             self.status = GameStatus.WIN
         elif self.bot_score == 10:
             self.status = GameStatus.LOSS
+        self.finished = self.status is not GameStatus.PENDING
 
 
 class RPSGame:
@@ -172,11 +211,16 @@ class RPSGame:
     def calculate_bot_move(self, player_move: RPSMove) -> RPSMove:
         """Calculates the next move of the bot and updates its weights."""
         bot_move = RPSMove(self.bot.predict())
-        self.bot.update_transitions(player_move.value)
+        self.bot.update_transitions(int(player_move))
         return bot_move
 
     def move(self, player_move: RPSMove) -> GameState:
-        """Get player's move and return the new state of the game."""
+        """
+        Get player's move and return the new state of the game.
+        Moves made after the game is finished are ignored.
+        """
+        if self.state.finished:
+            return self.state
         bot_move = self.calculate_bot_move(player_move)
         round_result = get_move_result(player_move, bot_move)
         self.state.update_score(round_result)
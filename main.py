@@ -14,6 +14,11 @@ BOT_IMAGE = "assets/bot.png"
 PLAYER_IMAGE = "assets/player.png"
 BACKGROUND_IMAGE = "assets/background.jpg"
 
+# Move images indexed by RPSMove.
+_MOVE_IMAGES = (ROCK_IMAGE, PAPER_IMAGE, SCISSORS_IMAGE)
+# Round result text and color indexed by RoundResult, except RoundResult.NONE.
+_ROUND_RESULT_STYLES = (("WIN", "green"), ("LOSS", "red"), ("TIE", "grey"))
+
 
 class MoveButton(ft.Container):
     """
@@ -87,18 +92,12 @@ class PlayerScreen(ft.Container):
         :param move: The move to set
         :return: None
         """
-        if not move:
+        if move is None or move is RPSMove.NONE:
             self.image_container.image_src = self.default_image_src
             self.image_container.image_opacity = 0.4
             return
         self.image_container.image_opacity = 1
-        match move:
-            case RPSMove.ROCK:
-                self.image_container.image_src = ROCK_IMAGE
-            case RPSMove.PAPER:
-                self.image_container.image_src = PAPER_IMAGE
-            case RPSMove.SCISSORS:
-                self.image_container.image_src = SCISSORS_IMAGE
+        self.image_container.image_src = _MOVE_IMAGES[move]
         self.image_container.update()
 
 
@@ -201,18 +200,10 @@ class GameContainer(ft.Container):
         :param round_result: The result of the round
         :return: None
         """
-        match round_result:
-            case RoundResult.WIN:
-                self.round_result.value = "WIN"
-                self.round_result.color = "green"
-            case RoundResult.LOSS:
-                self.round_result.value = "LOSS"
-                self.round_result.color = "red"
-            case RoundResult.TIE:
-                self.round_result.value = "TIE"
-                self.round_result.color = "grey"
-            case RoundResult.NONE:
-                self.round_result.value = ""
+        if round_result is RoundResult.NONE:
+            self.round_result.value = ""
+            return
+        self.round_result.value, self.round_result.color = _ROUND_RESULT_STYLES[round_result]
 
     def update_content(self, game_state: GameState) -> None:
         """
@@ -223,7 +214,7 @@ class GameContainer(ft.Container):
         self.turn_counter.value = f"Turn: {game_state.turn}"
         self.bot_score.value = f"Bot: {game_state.bot_score}"
         self.player_score.value = f"Player: {game_state.player_score}"
-        if not game_state.history:
+        if not game_state.rounds:
             self.player_screen.set_move_image()
             self.bot_screen.set_move_image()
             self.set_round_result(RoundResult.NONE)
@@ -233,7 +224,7 @@ class GameContainer(ft.Container):
         self.bot_screen.set_move_image(bot_move)
         self.set_round_result(round_result)
 
-        if game_state.is_finished():
+        if game_state.finished:
             self.finish_game(game_state.status)
 
         self.update()